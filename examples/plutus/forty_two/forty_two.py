@@ -32,7 +32,7 @@ chain_context = BlockFrostChainContext(
 )
 
 
-@retry(delay=20)
+@retry(delay=2, backoff=2, max_delay=20, jitter=(0, 1))
 def wait_for_tx(tx_id):
     chain_context.api.transaction(tx_id)
     print(f"Transaction {tx_id} has been successfully included in the blockchain.")
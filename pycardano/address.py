@@ -9,7 +9,7 @@ Specifications and references could be found in:
 from __future__ import annotations
 
 from enum import Enum
-from typing import Type, Union
+from typing import Any, Dict, Tuple, Type, Union
 
 from pycardano.crypto.bech32 import decode, encode
 from pycardano.exception import (
@@ -178,6 +178,26 @@ class PointerAddress(CBORSerializable):
         return f"PointerAddress({self.slot}, {self.tx_index}, {self.cert_index})"
 
 
+# Address type of each valid combination of payment part type and staking part type
+_ADDRESS_TYPES: Dict[Tuple[Type[Any], Type[Any]], AddressType] = {
+    (VerificationKeyHash, VerificationKeyHash): AddressType.KEY_KEY,
+    (VerificationKeyHash, ScriptHash): AddressType.KEY_SCRIPT,
+    (VerificationKeyHash, PointerAddress): AddressType.KEY_POINTER,
+    (VerificationKeyHash, type(None)): AddressType.KEY_NONE,
+    (ScriptHash, VerificationKeyHash): AddressType.SCRIPT_KEY,
+    (ScriptHash, ScriptHash): AddressType.SCRIPT_SCRIPT,
+    (ScriptHash, PointerAddress): AddressType.SCRIPT_POINTER,
+    (ScriptHash, type(None)): AddressType.SCRIPT_NONE,
+    (type(None), VerificationKeyHash): AddressType.NONE_KEY,
+    (type(None), ScriptHash): AddressType.NONE_SCRIPT,
+}
+
+# Payment part type and staking part type of each Shelley address type
+_ADDRESS_PARTS: Dict[AddressType, Tuple[Type[Any], Type[Any]]] = {
+    v: k for k, v in _ADDRESS_TYPES.items()
+}
+
+
 class Address(CBORSerializable):
     """A shelley address. It consists of two parts: payment part and staking part.
         Either of the parts could be None, but they cannot be None at the same time.
@@ -205,31 +225,11 @@ class Address(CBORSerializable):
 
     def _infer_address_type(self):
         """Guess address type from the combination of payment part and staking part."""
-        payment_type = type(self.payment_part)
-        staking_type = type(self.staking_part)
-        if payment_type == VerificationKeyHash:
-            if staking_type == VerificationKeyHash:
-                return AddressType.KEY_KEY
-            elif staking_type == ScriptHash:
-                return AddressType.KEY_SCRIPT
-            elif staking_type == PointerAddress:
-                return AddressType.KEY_POINTER
-            elif self.staking_part is None:
-                return AddressType.KEY_NONE
-        elif payment_type == ScriptHash:
-            if staking_type == VerificationKeyHash:
-                return AddressType.SCRIPT_KEY
-            elif staking_type == ScriptHash:
-                return AddressType.SCRIPT_SCRIPT
-            elif staking_type == PointerAddress:
-                return AddressType.SCRIPT_POINTER
-            elif self.staking_part is None:
-                return AddressType.SCRIPT_NONE
-        elif self.payment_part is None:
-            if staking_type == VerificationKeyHash:
-                return AddressType.NONE_KEY
-            elif staking_type == ScriptHash:
-                return AddressType.NONE_SCRIPT
+        address_type = _ADDRESS_TYPES.get(
+            (type(self.payment_part), type(self.staking_part))
+        )
+        if address_type is not None:
+            return address_type
 
         raise InvalidAddressInputException(
             f"Cannot construct a shelley address from a combination of "
@@ -348,51 +348,21 @@ class Address(CBORSerializable):
         payload = value[1:]
         addr_type = AddressType((header & 0xF0) >> 4)
         network = Network(header & 0x0F)
-        if addr_type == AddressType.KEY_KEY:
-            return cls(
-                VerificationKeyHash(payload[:VERIFICATION_KEY_HASH_SIZE]),
-                VerificationKeyHash(payload[VERIFICATION_KEY_HASH_SIZE:]),
-                network,
-            )
-        elif addr_type == AddressType.KEY_SCRIPT:
-            return cls(
-                VerificationKeyHash(payload[:VERIFICATION_KEY_HASH_SIZE]),
-                ScriptHash(payload[VERIFICATION_KEY_HASH_SIZE:]),
-                network,
-            )
-        elif addr_type == AddressType.KEY_POINTER:
-            pointer_addr = PointerAddress.decode(payload[VERIFICATION_KEY_HASH_SIZE:])
-            return cls(
-                VerificationKeyHash(payload[:VERIFICATION_KEY_HASH_SIZE]),
-                pointer_addr,
-                network,
-            )
-        elif addr_type == AddressType.KEY_NONE:
-            return cls(VerificationKeyHash(payload), None, network)
-        elif addr_type == AddressType.SCRIPT_KEY:
-            return cls(
-                ScriptHash(payload[:VERIFICATION_KEY_HASH_SIZE]),
-                VerificationKeyHash(payload[VERIFICATION_KEY_HASH_SIZE:]),
-                network,
-            )
-        elif addr_type == AddressType.SCRIPT_SCRIPT:
-            return cls(
-                ScriptHash(payload[:VERIFICATION_KEY_HASH_SIZE]),
-                ScriptHash(payload[VERIFICATION_KEY_HASH_SIZE:]),
-                network,
-            )
-        elif addr_type == AddressType.SCRIPT_POINTER:
-            pointer_addr = PointerAddress.decode(payload[VERIFICATION_KEY_HASH_SIZE:])
-            return cls(
-                ScriptHash(payload[:VERIFICATION_KEY_HASH_SIZE]), pointer_addr, network
-            )
-        elif addr_type == AddressType.SCRIPT_NONE:
-            return cls(ScriptHash(payload), None, network)
-        elif addr_type == AddressType.NONE_KEY:
-            return cls(None, VerificationKeyHash(payload), network)
-        elif addr_type == AddressType.NONE_SCRIPT:
-            return cls(None, ScriptHash(payload), network)
-        raise DeserializeException(f"Error in deserializing bytes: {value}")
+        parts = _ADDRESS_PARTS.get(addr_type)
+        if parts is None:
+            raise DeserializeException(f"Error in deserializing bytes: {value}")
+        payment_type, staking_type = parts
+        if payment_type is type(None):
+            return cls(None, staking_type(payload), network)
+        elif staking_type is type(None):
+            return cls(payment_type(payload), None, network)
+        payment_part = payment_type(payload[:VERIFICATION_KEY_HASH_SIZE])
+        staking_payload = payload[VERIFICATION_KEY_HASH_SIZE:]
+        if staking_type is PointerAddress:
+            staking_part = PointerAddress.decode(staking_payload)
+        else:
+            staking_part = staking_type(staking_payload)
+        return cls(payment_part, staking_part, network)
 
     def __eq__(self, other):
         if not isinstance(other, Address):
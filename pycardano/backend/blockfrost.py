@@ -1,12 +1,15 @@
 import os
+import random
 import tempfile
 import time
 import warnings
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import cbor2
+import requests
 from blockfrost import ApiError, ApiUrls, BlockFrostApi
 from blockfrost.utils import Namespace
+from cachetools import Cache, LRUCache, TTLCache
 
 from pycardano.address import Address
 from pycardano.backend.base import (
@@ -34,6 +37,41 @@ from pycardano.types import JsonDict
 
 __all__ = ["BlockFrostChainContext"]
 
+# HTTP status codes of transient failures: rate limiting and server side errors
+_RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _retry(
+    fn: Callable[..., Any],
+    *args,
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
+    **kwargs,
+) -> Any:
+    """Call `fn`, making up to `max_attempts` attempts with truncated exponential backoff in between
+    when BlockFrost reports a transient error or the request times out or fails to connect.
+
+    Errors with a status code that is not in :data:`_RETRYABLE_STATUS_CODES` are raised immediately.
+    """
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}.")
+    for attempt in range(max_attempts):
+        try:
+            return fn(*args, **kwargs)
+        except ApiError as e:
+            if (
+                e.status_code not in _RETRYABLE_STATUS_CODES
+                or attempt == max_attempts - 1
+            ):
+                raise
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            if attempt == max_attempts - 1:
+                raise
+        delay = min(max_delay, base_delay * 2**attempt)
+        time.sleep(delay * (1 + random.random() * jitter))
+
 
 def _try_fix_script(
     scripth: str, script: Union[PlutusV1Script, PlutusV2Script]
@@ -55,19 +93,29 @@ class BlockFrostChainContext(ChainContext):
         project_id (str): A BlockFrost project ID obtained from https://blockfrost.io.
         network (Network): Network to use.
         base_url (str): Base URL for the BlockFrost API. Defaults to the preprod url.
+        script_cache_size (int): Maximum number of reference scripts to cache, keyed by script hash.
+        utxo_cache_size (int): Maximum number of addresses whose UTxOs are cached. Only used when `utxo_cache_ttl`
+            is set.
+        utxo_cache_ttl (float): Number of seconds UTxO query results are cached, keyed by address. Defaults to
+            None, which disables the cache so every UTxO query makes a single request. A cached result can
+            include UTxOs spent in a block added after it was fetched, until it expires.
     """
 
     api: BlockFrostApi
-    _epoch_info: Namespace
-    _epoch: Optional[int] = None
+    _epoch_info: Optional[Namespace] = None
     _genesis_param: Optional[GenesisParameters] = None
     _protocol_param: Optional[ProtocolParameters] = None
+    _script_cache: Cache
+    _utxo_cache: Optional[Cache]
 
     def __init__(
         self,
         project_id: str,
         network: Optional[Network] = None,
         base_url: str = ApiUrls.preprod.value,
+        script_cache_size: int = 1000,
+        utxo_cache_size: int = 1000,
+        utxo_cache_ttl: Optional[float] = None,
     ):
         if network is not None:
             warnings.warn(
@@ -86,14 +134,19 @@ class BlockFrostChainContext(ChainContext):
             else ApiUrls.mainnet.value
         )
         self.api = BlockFrostApi(project_id=self._project_id, base_url=self._base_url)
-        self._epoch_info = self.api.epoch_latest()
-        self._epoch = None
+        self._epoch_info = None
         self._genesis_param = None
         self._protocol_param = None
+        self._script_cache = LRUCache(maxsize=script_cache_size)
+        self._utxo_cache = (
+            TTLCache(ttl=utxo_cache_ttl, maxsize=utxo_cache_size)
+            if utxo_cache_ttl is not None
+            else None
+        )
 
     def _check_epoch_and_update(self):
-        if int(time.time()) >= self._epoch_info.end_time:
-            self._epoch_info = self.api.epoch_latest()
+        if self._epoch_info is None or int(time.time()) >= self._epoch_info.end_time:
+            self._epoch_info = _retry(self.api.epoch_latest)
             return True
         else:
             return False
@@ -104,27 +157,27 @@ class BlockFrostChainContext(ChainContext):
 
     @property
     def epoch(self) -> int:
-        if not self._epoch or self._check_epoch_and_update():
-            new_epoch: int = self.api.epoch_latest().epoch
-            self._epoch = new_epoch
-        return self._epoch
+        self._check_epoch_and_update()
+        assert self._epoch_info is not None
+        epoch: int = self._epoch_info.epoch
+        return epoch
 
     @property
     def last_block_slot(self) -> int:
-        block = self.api.block_latest()
+        block = _retry(self.api.block_latest)
         return block.slot
 
     @property
     def genesis_param(self) -> GenesisParameters:
-        if not self._genesis_param or self._check_epoch_and_update():
-            params = vars(self.api.genesis())
+        if self._check_epoch_and_update() or not self._genesis_param:
+            params = vars(_retry(self.api.genesis))
             self._genesis_param = GenesisParameters(**params)
         return self._genesis_param
 
     @property
     def protocol_param(self) -> ProtocolParameters:
-        if not self._protocol_param or self._check_epoch_and_update():
-            params = self.api.epoch_latest_parameters()
+        if self._check_epoch_and_update() or not self._protocol_param:
+            params = _retry(self.api.epoch_latest_parameters)
             self._protocol_param = ProtocolParameters(
                 min_fee_constant=int(params.min_fee_b),
                 min_fee_coefficient=int(params.min_fee_a),
@@ -163,26 +216,48 @@ class BlockFrostChainContext(ChainContext):
     def _get_script(
         self, script_hash: str
     ) -> Union[PlutusV1Script, PlutusV2Script, NativeScript]:
-        script_type = self.api.script(script_hash).type
+        script = self._script_cache.get(script_hash, None)
+
+        if script is None:
+            script = self._fetch_script(script_hash)
+            self._script_cache[script_hash] = script
+
+        return script
+
+    def _fetch_script(
+        self, script_hash: str
+    ) -> Union[PlutusV1Script, PlutusV2Script, NativeScript]:
+        script_type = _retry(self.api.script, script_hash).type
         if script_type == "plutusV1":
             v1script = PlutusV1Script(
-                bytes.fromhex(self.api.script_cbor(script_hash).cbor)
+                bytes.fromhex(_retry(self.api.script_cbor, script_hash).cbor)
             )
             return _try_fix_script(script_hash, v1script)
         elif script_type == "plutusV2":
             v2script = PlutusV2Script(
-                bytes.fromhex(self.api.script_cbor(script_hash).cbor)
+                bytes.fromhex(_retry(self.api.script_cbor, script_hash).cbor)
             )
             return _try_fix_script(script_hash, v2script)
         else:
-            script_json: JsonDict = self.api.script_json(
-                script_hash, return_type="json"
+            script_json: JsonDict = _retry(
+                self.api.script_json, script_hash, return_type="json"
             )["json"]
             return NativeScript.from_dict(script_json)
 
     def _utxos(self, address: str) -> List[UTxO]:
+        if self._utxo_cache is None:
+            return self._fetch_utxos(address)
+
+        utxos = self._utxo_cache.get(address)
+        if utxos is None:
+            utxos = self._utxo_cache[address] = tuple(self._fetch_utxos(address))
+
+        # Hand out a copy so callers cannot modify the cached result
+        return list(utxos)
+
+    def _fetch_utxos(self, address: str) -> List[UTxO]:
         try:
-            results = self.api.address_utxos(address, gather_pages=True)
+            results = _retry(self.api.address_utxos, address, gather_pages=True)
         except ApiError as e:
             if e.status_code == 404:
                 return []
@@ -190,6 +265,7 @@ class BlockFrostChainContext(ChainContext):
                 raise e
 
         utxos = []
+        address_obj = Address.from_primitive(address)
 
         for result in results:
             tx_in = TransactionInput.from_primitive(
@@ -213,27 +289,27 @@ class BlockFrostChainContext(ChainContext):
 
             amount = Value(lovelace_amount, multi_assets)
 
+            inline_datum = getattr(result, "inline_datum", None)
+
             datum_hash = (
                 DatumHash.from_primitive(result.data_hash)
-                if result.data_hash and result.inline_datum is None
+                if result.data_hash and inline_datum is None
                 else None
             )
 
             datum = None
 
-            if hasattr(result, "inline_datum") and result.inline_datum is not None:
-                datum = RawCBOR(bytes.fromhex(result.inline_datum))
+            if inline_datum is not None:
+                datum = RawCBOR(bytes.fromhex(inline_datum))
 
             script = None
 
-            if (
-                hasattr(result, "reference_script_hash")
-                and result.reference_script_hash
-            ):
-                script = self._get_script(result.reference_script_hash)
+            reference_script_hash = getattr(result, "reference_script_hash", None)
+            if reference_script_hash:
+                script = self._get_script(reference_script_hash)
 
             tx_out = TransactionOutput(
-                Address.from_primitive(address),
+                address_obj,
                 amount=amount,
                 datum_hash=datum_hash,
                 datum=datum,
@@ -267,6 +343,9 @@ class BlockFrostChainContext(ChainContext):
                 f"Failed to submit transaction. Error code: {e.status_code}. Error message: {e.message}"
             ) from e
         os.remove(f.name)
+        # The submitted transaction spends UTxOs that may still be cached.
+        if self._utxo_cache is not None:
+            self._utxo_cache.clear()
         return response
 
     def evaluate_tx_cbor(self, cbor: Union[bytes, str]) -> Dict[str, ExecutionUnits]:
@@ -285,7 +364,7 @@ class BlockFrostChainContext(ChainContext):
             cbor = cbor.hex()
         with tempfile.NamedTemporaryFile(delete=False, mode="w") as f:
             f.write(cbor)
-        result = self.api.transaction_evaluate(f.name).result
+        result = _retry(self.api.transaction_evaluate, f.name).result
         os.remove(f.name)
         return_val = {}
         if not hasattr(result, "EvaluationResult"):
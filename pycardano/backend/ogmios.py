@@ -53,6 +53,7 @@ class OgmiosChainContext(ChainContext):
     _protocol_param: Optional[ProtocolParameters]
     _utxo_cache: Cache
     _datum_cache: Cache
+    _script_cache: Cache
 
     def __init__(
         self,
@@ -63,6 +64,7 @@ class OgmiosChainContext(ChainContext):
         refetch_chain_tip_interval: Optional[float] = None,
         utxo_cache_size: int = 10000,
         datum_cache_size: int = 10000,
+        script_cache_size: int = 10000,
     ):
         self._ws_url = ws_url
         self._network = network
@@ -87,6 +89,7 @@ class OgmiosChainContext(ChainContext):
             ttl=self._refetch_chain_tip_interval, maxsize=utxo_cache_size
         )
         self._datum_cache = LRUCache(maxsize=datum_cache_size)
+        self._script_cache = LRUCache(maxsize=script_cache_size)
 
     def _request(self, method: OgmiosQueryType, args: JsonDict) -> Any:
         ws = websocket.WebSocket()
@@ -308,6 +311,38 @@ class OgmiosChainContext(ChainContext):
         self._datum_cache[datum_hash] = datum
         return datum
 
+    def _get_script_from_kupo(
+        self, script_hash: str
+    ) -> Union[PlutusV1Script, PlutusV2Script]:
+        """Get a reference script from Kupo.
+
+        Args:
+            script_hash (str): A script hash.
+
+        Returns:
+            Union[PlutusV1Script, PlutusV2Script]: A plutus script.
+        """
+        if script_hash in self._script_cache:
+            return self._script_cache[script_hash]
+
+        if self._kupo_url is None:
+            raise AssertionError(
+                "kupo_url object attribute has not been assigned properly."
+            )
+
+        kupo_script_url = self._kupo_url + "/scripts/" + script_hash
+        script = requests.get(kupo_script_url).json()
+        if script["language"] == "plutus:v2":
+            script = PlutusV2Script(bytes.fromhex(script["script"]))
+        elif script["language"] == "plutus:v1":
+            script = PlutusV1Script(bytes.fromhex(script["script"]))
+        else:
+            raise ValueError("Unknown plutus script type")
+        script = _try_fix_script(script_hash, script)
+
+        self._script_cache[script_hash] = script
+        return script
+
     def _utxos_kupo(self, address: str) -> List[UTxO]:
         """Get all UTxOs associated with an address with Kupo.
         Since UTxO querying will be deprecated from Ogmios in next
@@ -328,6 +363,7 @@ class OgmiosChainContext(ChainContext):
         results = requests.get(kupo_utxo_url).json()
 
         utxos = []
+        address_obj = Address.from_primitive(address)
 
         for result in results:
             tx_id = result["transaction_id"]
@@ -341,16 +377,7 @@ class OgmiosChainContext(ChainContext):
                 script = None
                 script_hash = result.get("script_hash", None)
                 if script_hash:
-                    kupo_script_url = self._kupo_url + "/scripts/" + script_hash
-                    script = requests.get(kupo_script_url).json()
-                    if script["language"] == "plutus:v2":
-                        script = PlutusV2Script(bytes.fromhex(script["script"]))
-                        script = _try_fix_script(script_hash, script)
-                    elif script["language"] == "plutus:v1":
-                        script = PlutusV1Script(bytes.fromhex(script["script"]))
-                        script = _try_fix_script(script_hash, script)
-                    else:
-                        raise ValueError("Unknown plutus script type")
+                    script = self._get_script_from_kupo(script_hash)
 
                 datum = None
                 datum_hash = (
@@ -365,7 +392,7 @@ class OgmiosChainContext(ChainContext):
 
                 if not result["value"]["assets"]:
                     tx_out = TransactionOutput(
-                        Address.from_primitive(address),
+                        address_obj,
                         amount=lovelace_amount,
                         datum_hash=datum_hash,
                         datum=datum,
@@ -383,7 +410,7 @@ class OgmiosChainContext(ChainContext):
                         ] = quantity
 
                     tx_out = TransactionOutput(
-                        Address.from_primitive(address),
+                        address_obj,
                         amount=Value(lovelace_amount, multi_assets),
                         datum_hash=datum_hash,
                         datum=datum,
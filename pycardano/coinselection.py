@@ -305,7 +305,7 @@ class RandomImproveMultiAsset(UTxOSelector):
                 self._improve(
                     selected,
                     selected_amount,
-                    list(remaining),
+                    remaining,
                     ideal,
                     upper_bound,
                     max_input_count,
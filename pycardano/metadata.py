@@ -31,7 +31,18 @@ class Metadata(DictCBORSerializable):
     INTERNAL_TYPES = (dict, list, int, bytes, str)
 
     def _validate(self):
-        def _validate_type_and_size(data):
+        for k in self:
+            if not isinstance(k, self.KEY_TYPE):
+                raise InvalidArgumentException(
+                    f"Keys in the first layer of Metadata has to be {self.KEY_TYPE}, "
+                    f"got {type(k)} instead."
+                )
+
+        # Walk nested values with an explicit stack instead of recursion, so deeply
+        # nested metadata neither pays a call per node nor hits the recursion limit.
+        stack = list(self.values())
+        while stack:
+            data = stack.pop()
             if not isinstance(data, self.INTERNAL_TYPES):
                 raise InvalidArgumentException(
                     f"A value in Metadata has to be one of {self.INTERNAL_TYPES}, "
@@ -43,24 +54,19 @@ class Metadata(DictCBORSerializable):
                         f"The size of {data} exceeds {self.MAX_ITEM_SIZE} bytes."
                     )
             elif isinstance(data, str):
-                if len(data.encode("utf-8")) > self.MAX_ITEM_SIZE:
+                # A character takes at least one byte in UTF-8, and exactly one if it is ASCII,
+                # so the string only needs to be encoded when neither shortcut applies.
+                if len(data) > self.MAX_ITEM_SIZE or (
+                    not data.isascii()
+                    and len(data.encode("utf-8")) > self.MAX_ITEM_SIZE
+                ):
                     raise InvalidArgumentException(
                         f"The size of {data} exceeds {self.MAX_ITEM_SIZE} bytes."
                     )
             elif isinstance(data, list):
-                for item in data:
-                    _validate_type_and_size(item)
+                stack.extend(data)
             elif isinstance(data, dict):
-                for key in data:
-                    _validate_type_and_size(data[key])
-
-        for k in self:
-            if not isinstance(k, self.KEY_TYPE):
-                raise InvalidArgumentException(
-                    f"Keys in the first layer of Metadata has to be {self.KEY_TYPE}, "
-                    f"got {type(k)} instead."
-                )
-            _validate_type_and_size(self[k])
+                stack.extend(data.values())
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
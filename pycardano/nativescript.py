@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import ClassVar, List, Type, Union, cast
+from typing import ClassVar, Dict, List, Type, Union, cast
 
 from nacl.encoding import RawEncoder
 from nacl.hash import blake2b
@@ -42,20 +42,10 @@ class NativeScript(ArrayCBORSerializable):
         ScriptPubkey, ScriptAll, ScriptAny, ScriptNofK, InvalidBefore, InvalidHereAfter
     ]:
         script_type: int = value[0]
-        if script_type == ScriptPubkey._TYPE:
-            return super(NativeScript, ScriptPubkey).from_primitive(value[1:])
-        elif script_type == ScriptAll._TYPE:
-            return super(NativeScript, ScriptAll).from_primitive(value[1:])
-        elif script_type == ScriptAny._TYPE:
-            return super(NativeScript, ScriptAny).from_primitive(value[1:])
-        elif script_type == ScriptNofK._TYPE:
-            return super(NativeScript, ScriptNofK).from_primitive(value[1:])
-        elif script_type == InvalidBefore._TYPE:
-            return super(NativeScript, InvalidBefore).from_primitive(value[1:])
-        elif script_type == InvalidHereAfter._TYPE:
-            return super(NativeScript, InvalidHereAfter).from_primitive(value[1:])
-        else:
+        script_class = INT_TO_SCRIPT_CLASS.get(script_type)
+        if script_class is None:
             raise DeserializeException(f"Unknown script type indicator: {script_type}")
+        return super(NativeScript, script_class).from_primitive(value[1:])
 
     def hash(self) -> ScriptHash:
         cbor_bytes = cast(bytes, self.to_cbor())
@@ -205,3 +195,12 @@ JSON_TAG_TO_INT = {
     InvalidBefore.json_tag: InvalidBefore._TYPE,
     InvalidHereAfter.json_tag: InvalidHereAfter._TYPE,
 }
+
+INT_TO_SCRIPT_CLASS: Dict[int, Type[NativeScript]] = {
+    ScriptPubkey._TYPE: ScriptPubkey,
+    ScriptAll._TYPE: ScriptAll,
+    ScriptAny._TYPE: ScriptAny,
+    ScriptNofK._TYPE: ScriptNofK,
+    InvalidBefore._TYPE: InvalidBefore,
+    InvalidHereAfter._TYPE: InvalidHereAfter,
+}
@@ -62,7 +62,7 @@ class TransactionInput(ArrayCBORSerializable):
     index: int
 
     def __hash__(self):
-        return hash(str(self.transaction_id) + str(self.index))
+        return hash((self.transaction_id, self.index))
 
 
 class AssetName(ConstrainedBytes):
@@ -186,12 +186,13 @@ class MultiAsset(DictCBORSerializable):
         """
         new_multi_asset = MultiAsset()
 
-        for p in self:
-            for n in self[p]:
-                if criteria(p, n, self[p][n]):
-                    if p not in new_multi_asset:
-                        new_multi_asset[p] = Asset()
-                    new_multi_asset[p][n] = self[p][n]
+        for p, assets in self.items():
+            new_assets = Asset()
+            for n, v in assets.items():
+                if criteria(p, n, v):
+                    new_assets[n] = v
+            if new_assets:
+                new_multi_asset[p] = new_assets
 
         return new_multi_asset
 
@@ -206,9 +207,9 @@ class MultiAsset(DictCBORSerializable):
             int: Total number of distinct assets that satisfy the criteria.
         """
         count = 0
-        for p in self:
-            for n in self[p]:
-                if criteria(p, n, self[p][n]):
+        for p, assets in self.items():
+            for n, v in assets.items():
+                if criteria(p, n, v):
                     count += 1
 
         return count
@@ -466,7 +467,8 @@ class UTxO(ArrayCBORSerializable):
         return pformat(vars(self))
 
     def __hash__(self):
-        return hash(blake2b(self.input.to_cbor() + self.output.to_cbor(), 32))
+        # An input can only be spent once, so it is enough to identify the UTxO.
+        return hash(self.input)
 
 
 class Withdrawals(DictCBORSerializable):
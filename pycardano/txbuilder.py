@@ -214,18 +214,14 @@ class TransactionBuilder:
                 f"but got {utxo.output.address.address_type} instead."
             )
 
-        if (
-            utxo.output.datum_hash
-            and datum is not None
-            and utxo.output.datum_hash != datum_hash(datum)
-        ):
-            raise InvalidArgumentException(
-                f"Datum hash in transaction output is {utxo.output.datum_hash}, "
-                f"but actual datum hash from input datum is {datum_hash(datum)}."
-            )
-
         if datum is not None:
-            self.datums[datum_hash(datum)] = datum
+            input_datum_hash = datum_hash(datum)
+            if utxo.output.datum_hash and utxo.output.datum_hash != input_datum_hash:
+                raise InvalidArgumentException(
+                    f"Datum hash in transaction output is {utxo.output.datum_hash}, "
+                    f"but actual datum hash from input datum is {input_datum_hash}."
+                )
+            self.datums[input_datum_hash] = datum
 
         if redeemer:
             if redeemer.tag is not None and redeemer.tag != RedeemerTag.SPEND:
@@ -324,9 +320,9 @@ class TransactionBuilder:
         """
         if datum is not None:
             tx_out.datum_hash = datum_hash(datum)
+            if add_datum_to_witness:
+                self.datums[tx_out.datum_hash] = datum
         self.outputs.append(tx_out)
-        if datum is not None and add_datum_to_witness:
-            self.datums[datum_hash(datum)] = datum
         return self
 
     @property
@@ -361,8 +357,7 @@ class TransactionBuilder:
     def fee(self, fee: int):
         self._fee = fee
 
-    @property
-    def all_scripts(self) -> List[ScriptType]:
+    def _scripts_by_hash(self) -> Dict[ScriptHash, ScriptType]:
         scripts: Dict[ScriptHash, ScriptType] = {}
         s: ScriptType
 
@@ -376,18 +371,19 @@ class TransactionBuilder:
         for s, _ in self._minting_script_to_redeemers:
             scripts[script_hash(s)] = s
 
-        return list(scripts.values())
+        return scripts
+
+    @property
+    def all_scripts(self) -> List[ScriptType]:
+        return list(self._scripts_by_hash().values())
 
     @property
     def scripts(self) -> List[ScriptType]:
-        scripts: Dict[ScriptHash, ScriptType] = {
-            script_hash(s): s for s in self.all_scripts
-        }
+        scripts = self._scripts_by_hash()
         s: ScriptType
 
         for s in self._reference_scripts:
-            if script_hash(s) in scripts:
-                scripts.pop(script_hash(s))
+            scripts.pop(script_hash(s), None)
 
         return list(scripts.values())
 
@@ -458,13 +454,15 @@ class TransactionBuilder:
 
         # when there is only ADA left, simply use remaining coin value as change
         if not change.multi_asset:
-            if respect_min_utxo and change.coin < min_lovelace_post_alonzo(
-                TransactionOutput(address, change), self.context
-            ):
-                raise InsufficientUTxOBalanceException(
-                    f"Not enough ADA left for change: {change.coin} but needs "
-                    f"{min_lovelace_post_alonzo(TransactionOutput(address, change), self.context)}"
+            if respect_min_utxo:
+                min_change_lovelace = min_lovelace_post_alonzo(
+                    TransactionOutput(address, change), self.context
                 )
+                if change.coin < min_change_lovelace:
+                    raise InsufficientUTxOBalanceException(
+                        f"Not enough ADA left for change: {change.coin} but needs "
+                        f"{min_change_lovelace}"
+                    )
             lovelace_change = Value(change.coin)
             change_output_arr.append(TransactionOutput(address, lovelace_change))
 
@@ -477,24 +475,26 @@ class TransactionBuilder:
 
             # Include minimum lovelace into each token output except for the last one
             for i, multi_asset in enumerate(multi_asset_arr):
+                is_last = i == len(multi_asset_arr) - 1
+
                 # Combine remainder of provided ADA with last MultiAsset for output
                 # There may be rare cases where adding ADA causes size exceeds limit
                 # We will revisit if it becomes an issue
-                if respect_min_utxo and change.coin < min_lovelace_post_alonzo(
-                    TransactionOutput(address, Value(0, multi_asset)), self.context
-                ):
+                if respect_min_utxo or not is_last:
+                    min_change_lovelace = min_lovelace_post_alonzo(
+                        TransactionOutput(address, Value(0, multi_asset)), self.context
+                    )
+
+                if respect_min_utxo and change.coin < min_change_lovelace:
                     raise InsufficientUTxOBalanceException(
                         "Not enough ADA left to cover non-ADA assets in a change address"
                     )
 
-                if i == len(multi_asset_arr) - 1:
+                if is_last:
                     # Include all ada in last output
                     change_value = Value(change.coin, multi_asset)
                 else:
-                    change_value = Value(0, multi_asset)
-                    change_value.coin = min_lovelace_post_alonzo(
-                        TransactionOutput(address, change_value), self.context
-                    )
+                    change_value = Value(min_change_lovelace, multi_asset)
 
                 change_output_arr.append(TransactionOutput(address, change_value))
                 change -= change_value
@@ -732,7 +732,7 @@ class TransactionBuilder:
         # https://hydra.iohk.io/build/13099856/download/1/alonzo-changes.pdf
 
         if self.mint:
-            sorted_mint_policies = sorted(self.mint.keys(), key=lambda x: x.to_cbor())
+            sorted_mint_policies = sorted(self.mint.keys(), key=lambda x: x.payload)
         else:
             sorted_mint_policies = []
 
@@ -809,15 +809,17 @@ class TransactionBuilder:
             tx_body.fee = max_tx_fee(self.context)
 
         witness = self._build_fake_witness_set()
-        tx = Transaction(tx_body, witness, True, self.auxiliary_data)
-        size = len(tx.to_cbor())
+        return Transaction(tx_body, witness, True, self.auxiliary_data)
+
+    def _full_fake_tx_size(self) -> int:
+        size = len(self._build_full_fake_tx().to_cbor())
         if size > self.context.protocol_param.max_tx_size:
             raise InvalidTransactionException(
                 f"Transaction size ({size}) exceeds the max limit "
                 f"({self.context.protocol_param.max_tx_size}). Please try reducing the "
                 f"number of inputs or outputs."
             )
-        return tx
+        return size
 
     def build_witness_set(self) -> TransactionWitnessSet:
         """Build a transaction witness set, excluding verification key witnesses.
@@ -868,7 +870,7 @@ class TransactionBuilder:
 
         estimated_fee = fee(
             self.context,
-            len(self._build_full_fake_tx().to_cbor()),
+            self._full_fake_tx_size(),
             plutus_execution_units.steps,
             plutus_execution_units.mem,
         )
@@ -1005,9 +1007,11 @@ class TransactionBuilder:
                 seen_utxos.add(utxo)
                 additional_utxo_pool.append(utxo)
 
+            excluded_utxos = set(self.excluded_inputs)
+
             for address in self.input_addresses:
                 for utxo in self.context.utxos(address):
-                    if utxo not in seen_utxos and utxo not in self.excluded_inputs:
+                    if utxo not in seen_utxos and utxo not in excluded_utxos:
                         additional_utxo_pool.append(utxo)
                         additional_amount += utxo.output.amount
                         seen_utxos.add(utxo)
@@ -1034,7 +1038,7 @@ class TransactionBuilder:
                 except UTxOSelectionException as e:
                     if index < len(self.utxo_selectors) - 1:
                         logger.info(e)
-                        logger.info(f"{selector} failed. Trying next selector.")
+                        logger.info("%s failed. Trying next selector.", selector)
                     else:
                         trimmed_additional_amount = Value(
                             additional_amount.coin,
@@ -1060,10 +1064,10 @@ class TransactionBuilder:
                         )
 
         selected_utxos.sort(
-            key=lambda utxo: (str(utxo.input.transaction_id), utxo.input.index)
+            key=lambda utxo: (utxo.input.transaction_id.payload, utxo.input.index)
         )
 
-        self.inputs[:] = selected_utxos[:]
+        self.inputs[:] = selected_utxos
 
         # Automatically set the required signers for smart transactions
         if (
@@ -1128,7 +1132,7 @@ class TransactionBuilder:
                         cur_total += candidate.output.amount
 
             sorted_inputs = sorted(
-                self.inputs.copy(),
+                self.inputs,
                 key=lambda i: (len(i.output.to_cbor_hex()), -i.output.amount.coin),
             )
             _add_collateral_input(tmp_val, sorted_inputs)
@@ -1272,8 +1276,9 @@ class TransactionBuilder:
         witness_set = self.build_witness_set()
         witness_set.vkey_witnesses = []
 
+        tx_body_hash = tx_body.hash()
         for signing_key in set(signing_keys):
-            signature = signing_key.sign(tx_body.hash())
+            signature = signing_key.sign(tx_body_hash)
             witness_set.vkey_witnesses.append(
                 VerificationKeyWitness(signing_key.to_verification_key(), signature)
             )
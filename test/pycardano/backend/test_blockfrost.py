@@ -0,0 +1,275 @@
+import time
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from blockfrost import ApiError
+from cachetools import TTLCache
+
+from pycardano.backend.blockfrost import BlockFrostChainContext, _retry
+from pycardano.hash import DatumHash, VerificationKeyHash
+from pycardano.nativescript import ScriptPubkey
+
+TEST_ADDR = "addr_test1vr2p8st5t5cxqglyjky7vk98k7jtfhdpvhl4e97cezuhn0cqcexl7"
+
+
+def _api_error(status_code: int) -> ApiError:
+    response = MagicMock()
+    response.json.return_value = {
+        "status_code": status_code,
+        "error": "Error",
+        "message": "Error message",
+    }
+    return ApiError(response)
+
+
+def _utxo_result(tx_hash: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        tx_hash=tx_hash,
+        output_index=0,
+        amount=[SimpleNamespace(unit="lovelace", quantity="5000000")],
+        data_hash=None,
+        inline_datum=None,
+        reference_script_hash=None,
+    )
+
+
+@pytest.fixture
+def clock():
+    return SimpleNamespace(now=0.0)
+
+
+@pytest.fixture
+def chain_context(request, clock):
+    # Indirectly parametrize with a number of seconds to enable the UTxO cache.
+    with patch("pycardano.backend.blockfrost.BlockFrostApi"), patch(
+        "pycardano.backend.blockfrost.TTLCache",
+        partial(TTLCache, timer=lambda: clock.now),
+    ):
+        context = BlockFrostChainContext(
+            "project_id", utxo_cache_ttl=getattr(request, "param", None)
+        )
+    return context
+
+
+@patch("pycardano.backend.blockfrost.time.sleep")
+def test_retry_recovers_from_transient_error(mock_sleep):
+    fn = MagicMock(side_effect=[_api_error(429), _api_error(503), "result"])
+    assert _retry(fn, "arg", key="value") == "result"
+    assert fn.call_count == 3
+    fn.assert_called_with("arg", key="value")
+    assert mock_sleep.call_count == 2
+
+
+@patch("pycardano.backend.blockfrost.time.sleep")
+def test_retry_gives_up_after_max_attempts(mock_sleep):
+    fn = MagicMock(side_effect=_api_error(500))
+    with pytest.raises(ApiError):
+        _retry(fn, max_attempts=3)
+    assert fn.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("pycardano.backend.blockfrost.time.sleep")
+def test_retry_recovers_from_timeout_and_connection_error(mock_sleep):
+    fn = MagicMock(
+        side_effect=[
+            requests.exceptions.Timeout(),
+            requests.exceptions.ConnectionError(),
+            "result",
+        ]
+    )
+    assert _retry(fn) == "result"
+    assert fn.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("pycardano.backend.blockfrost.time.sleep")
+def test_retry_gives_up_on_repeated_timeout(mock_sleep):
+    fn = MagicMock(side_effect=requests.exceptions.Timeout())
+    with pytest.raises(requests.exceptions.Timeout):
+        _retry(fn, max_attempts=2)
+    assert fn.call_count == 2
+    assert mock_sleep.call_count == 1
+
+
+@patch("pycardano.backend.blockfrost.time.sleep")
+def test_retry_does_not_retry_unrecoverable_error(mock_sleep):
+    fn = MagicMock(side_effect=_api_error(400))
+    with pytest.raises(ApiError):
+        _retry(fn)
+    assert fn.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_retry_requires_an_attempt():
+    fn = MagicMock()
+    with pytest.raises(ValueError):
+        _retry(fn, max_attempts=0)
+    fn.assert_not_called()
+
+
+@patch("pycardano.backend.blockfrost.time.sleep")
+def test_utxos_retry_on_rate_limit(mock_sleep, chain_context):
+    chain_context.api.address_utxos.side_effect = [_api_error(429), []]
+    assert chain_context.utxos(TEST_ADDR) == []
+    assert chain_context.api.address_utxos.call_count == 2
+
+
+@patch("pycardano.backend.blockfrost.time.sleep")
+def test_epoch_retry_on_rate_limit(mock_sleep, chain_context):
+    chain_context.api.epoch_latest.side_effect = [
+        _api_error(429),
+        SimpleNamespace(epoch=300, end_time=int(time.time()) + 1000),
+    ]
+    assert chain_context.epoch == 300
+    assert chain_context.api.epoch_latest.call_count == 2
+
+
+@pytest.mark.parametrize("chain_context", [None, 20], indirect=True)
+def test_utxos_not_found(chain_context):
+    chain_context.api.address_utxos.side_effect = _api_error(404)
+    assert chain_context.utxos(TEST_ADDR) == []
+
+
+def test_utxos_reference_script_cached(chain_context):
+    key_hash = "9c5d9076b1ec59ef5b3f4b7b96a1f4d34ec5e35f23a1e5ab4a8569ae"
+    script_hash = "5ff3a16a5338510c4be0244ee4bb348a507316df1057d1cf41fb5d3b"
+    chain_context.api.address_utxos.return_value = [
+        SimpleNamespace(
+            tx_hash="3a42f652bd8dee788577e8c39b6217db3df659c33b10a2814c20fb66089ca167",
+            output_index=i,
+            amount=[SimpleNamespace(unit="lovelace", quantity="5000000")],
+            data_hash=None,
+            inline_datum=None,
+            reference_script_hash=script_hash,
+        )
+        for i in range(3)
+    ]
+    chain_context.api.script.return_value = SimpleNamespace(type="timelock")
+    chain_context.api.script_json.return_value = {
+        "json": {"type": "sig", "keyHash": key_hash}
+    }
+
+    utxos = chain_context.utxos(TEST_ADDR)
+
+    assert len(utxos) == 3
+    assert all(
+        utxo.output.script == ScriptPubkey(VerificationKeyHash.from_primitive(key_hash))
+        for utxo in utxos
+    )
+    assert chain_context.api.script.call_count == 1
+    assert chain_context.api.script_json.call_count == 1
+
+    chain_context.utxos(TEST_ADDR)
+    assert chain_context.api.address_utxos.call_count == 2
+    assert chain_context.api.script.call_count == 1
+
+
+def test_utxos_uncached_api_calls(chain_context):
+    chain_context.api.address_utxos.return_value = []
+
+    chain_context.utxos(TEST_ADDR)
+    assert chain_context.api.address_utxos.call_count == 1
+
+    chain_context.utxos(TEST_ADDR)
+    assert chain_context.api.address_utxos.call_count == 2
+    chain_context.api.block_latest.assert_not_called()
+
+
+@pytest.mark.parametrize("chain_context", [20], indirect=True)
+def test_utxos_cached_until_expired(chain_context, clock):
+    chain_context.api.address_utxos.return_value = []
+
+    chain_context.utxos(TEST_ADDR)
+    clock.now += 19
+    chain_context.utxos(TEST_ADDR)
+    assert chain_context.api.address_utxos.call_count == 1
+
+    clock.now += 1
+    chain_context.utxos(TEST_ADDR)
+    assert chain_context.api.address_utxos.call_count == 2
+    chain_context.api.block_latest.assert_not_called()
+
+
+@pytest.mark.parametrize("chain_context", [20], indirect=True)
+def test_utxos_cached_result_not_modified_by_caller(chain_context):
+    tx_hash = "3a42f652bd8dee788577e8c39b6217db3df659c33b10a2814c20fb66089ca167"
+    chain_context.api.address_utxos.return_value = [_utxo_result(tx_hash)]
+
+    chain_context.utxos(TEST_ADDR).pop()
+    chain_context.utxos(TEST_ADDR).pop()
+
+    [utxo] = chain_context.utxos(TEST_ADDR)
+    assert str(utxo.input.transaction_id) == tx_hash
+    assert chain_context.api.address_utxos.call_count == 1
+
+
+@pytest.mark.parametrize("chain_context", [20], indirect=True)
+def test_submit_tx_clears_cached_utxos(chain_context):
+    spent_tx = "3a42f652bd8dee788577e8c39b6217db3df659c33b10a2814c20fb66089ca167"
+    new_tx = "46f7d8f8273b2d4a8250ab9c87d53b3d7d2a2b465d2a977c1d0b6d6ab1bb38e1"
+    chain_context.api.address_utxos.return_value = [_utxo_result(spent_tx)]
+    chain_context.utxos(TEST_ADDR)
+
+    chain_context.submit_tx_cbor(b"\x80")
+    chain_context.api.address_utxos.return_value = [_utxo_result(new_tx)]
+    [utxo] = chain_context.utxos(TEST_ADDR)
+    assert str(utxo.input.transaction_id) == new_tx
+
+
+def test_epoch_fetched_lazily(chain_context):
+    chain_context.api.epoch_latest.assert_not_called()
+
+    chain_context.api.epoch_latest.return_value = SimpleNamespace(
+        epoch=300, end_time=int(time.time()) + 1000
+    )
+    assert chain_context.epoch == 300
+    assert chain_context.epoch == 300
+    assert chain_context.api.epoch_latest.call_count == 1
+
+
+def test_utxos_without_inline_datum_field(chain_context):
+    data_hash = "923918e403bf43c34b4ef6b48eb2ee04babed17320d8d1b9ff9ad086e86f44ec"
+    chain_context.api.address_utxos.return_value = [
+        SimpleNamespace(
+            tx_hash="3a42f652bd8dee788577e8c39b6217db3df659c33b10a2814c20fb66089ca167",
+            output_index=0,
+            amount=[SimpleNamespace(unit="lovelace", quantity="5000000")],
+            data_hash=data_hash,
+        )
+    ]
+
+    [utxo] = chain_context.utxos(TEST_ADDR)
+
+    assert utxo.output.datum_hash == DatumHash.from_primitive(data_hash)
+    assert utxo.output.datum is None
+    assert utxo.output.script is None
+
+
+def test_epoch_refreshed_after_epoch_end(chain_context):
+    chain_context.api.epoch_latest.side_effect = [
+        SimpleNamespace(epoch=300, end_time=int(time.time()) - 1),
+        SimpleNamespace(epoch=301, end_time=int(time.time()) + 1000),
+    ]
+    assert chain_context.epoch == 300
+    assert chain_context.epoch == 301
+    assert chain_context.epoch == 301
+    assert chain_context.api.epoch_latest.call_count == 2
+
+
+def test_epoch_refreshed_after_genesis_param_read_across_epoch_end(chain_context):
+    chain_context.api.epoch_latest.side_effect = [
+        SimpleNamespace(epoch=300, end_time=int(time.time()) - 1),
+        SimpleNamespace(epoch=301, end_time=int(time.time()) + 1000),
+    ]
+    chain_context.api.genesis.return_value = SimpleNamespace()
+    assert chain_context.epoch == 300
+
+    # The epoch rollover is noticed while reading the genesis parameters.
+    with patch("pycardano.backend.blockfrost.GenesisParameters"):
+        chain_context.genesis_param
+    assert chain_context.epoch == 301
+    assert chain_context.api.epoch_latest.call_count == 2
@@ -5,6 +5,7 @@ import pytest
 from pycardano.backend.base import GenesisParameters, ProtocolParameters
 from pycardano.backend.ogmios import OgmiosChainContext
 from pycardano.network import Network
+from pycardano.plutus import PlutusV2Script, script_hash
 from pycardano.transaction import MultiAsset, TransactionInput
 
 PROTOCOL_RESULT = {
@@ -216,3 +217,17 @@ class TestOgmiosChainContext:
             2,
         )
         assert not_utxo is None
+
+    def test_get_script_from_kupo_cached(self, chain_context):
+        script = PlutusV2Script(b"dummy script")
+        scripth = str(script_hash(script))
+        chain_context._kupo_url = "http://localhost:1442"
+
+        with patch("pycardano.backend.ogmios.requests.get") as mock_get:
+            mock_get.return_value.json.return_value = {
+                "language": "plutus:v2",
+                "script": script.hex(),
+            }
+            assert chain_context._get_script_from_kupo(scripth) == script
+            assert chain_context._get_script_from_kupo(scripth) == script
+            mock_get.assert_called_once_with("http://localhost:1442/scripts/" + scripth)
@@ -1,3 +1,4 @@
+import sys
 from test.pycardano.util import check_two_way_cbor
 
 import pytest
@@ -126,6 +127,9 @@ def test_metadata_valid_size():
     }
     Metadata(data)
 
+    data = {123: {"1": "é" * (Metadata.MAX_ITEM_SIZE // 2)}}
+    Metadata(data)
+
 
 def test_metadata_invalid_size():
     data = {123: {"1": bytes(Metadata.MAX_ITEM_SIZE + 1)}}
@@ -137,3 +141,32 @@ def test_metadata_invalid_size():
 
     with pytest.raises(InvalidArgumentException):
         Metadata(data)
+
+    data = {123: {"1": "é" * (Metadata.MAX_ITEM_SIZE // 2 + 1)}}
+
+    with pytest.raises(InvalidArgumentException):
+        Metadata(data)
+
+
+def test_metadata_deeply_nested():
+    nested = "abc"
+    for _ in range(sys.getrecursionlimit() * 2):
+        nested = [nested]
+    Metadata({123: nested})
+
+    nested = bytes(Metadata.MAX_ITEM_SIZE + 1)
+    for _ in range(sys.getrecursionlimit() * 2):
+        nested = {"1": nested}
+    with pytest.raises(InvalidArgumentException):
+        Metadata({123: nested})
+
+
+def test_metadata_string_list():
+    Metadata({674: {"msg": ["a" * Metadata.MAX_ITEM_SIZE] * 10}})
+    Metadata({674: {"msg": ["é" * (Metadata.MAX_ITEM_SIZE // 2)] * 10}})
+
+    with pytest.raises(InvalidArgumentException):
+        Metadata({674: {"msg": ["a"] * 10 + ["a" * (Metadata.MAX_ITEM_SIZE + 1)]}})
+
+    with pytest.raises(InvalidArgumentException):
+        Metadata({674: {"msg": ["é" * (Metadata.MAX_ITEM_SIZE // 2 + 1)]}})
@@ -17,6 +17,7 @@ from pycardano.transaction import (
     TransactionBody,
     TransactionInput,
     TransactionOutput,
+    UTxO,
     Value,
 )
 from pycardano.witness import TransactionWitnessSet, VerificationKeyWitness
@@ -32,6 +33,28 @@ def test_transaction_input():
     check_two_way_cbor(tx_in)
 
 
+def test_utxo_hash():
+    tx_id_hex = "732bfd67e66be8e8288349fcaaa2294973ef6271cc189a239bb431275401b8e5"
+    addr = Address.decode(
+        "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+    )
+    utxo = UTxO(
+        TransactionInput(TransactionId(bytes.fromhex(tx_id_hex)), 0),
+        TransactionOutput(addr, 100000000000),
+    )
+    same_utxo = UTxO(
+        TransactionInput.from_primitive([tx_id_hex, 0]),
+        TransactionOutput(addr, 100000000000),
+    )
+    other_utxo = UTxO(
+        TransactionInput.from_primitive([tx_id_hex, 1]),
+        TransactionOutput(addr, 100000000000),
+    )
+    assert hash(utxo.input) == hash(same_utxo.input)
+    assert hash(utxo) == hash(same_utxo)
+    assert {utxo, same_utxo, other_utxo} == {utxo, other_utxo}
+
+
 def test_transaction_output():
     addr = Address.decode(
         "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"